@@ -12,79 +12,215 @@ metrics for each section as well as overall text analysis.
 """
 
 import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
+import numpy as np
+import spacy
+from spacy.tokens import Doc
 from nltk.corpus import stopwords
-from nltk.probability import FreqDist
 from collections import Counter
+from contextlib import nullcontext
+from functools import lru_cache
+from importlib.resources import files
 import string
-from spellchecker import SpellChecker
+import sys
+from symspellpy import SymSpell, Verbosity
 from pathlib import Path
 
-def count_complex_words(words):
+# Set once the NLTK data has been found or downloaded
+_NLTK_READY = False
+
+def _ensure_nltk_data():
+    """Download required NLTK data if not already present, checking only once per run."""
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+    _NLTK_READY = True
+
+@lru_cache(maxsize=1)
+def _get_stop_words():
+    """Return the English stopword set, read from the NLTK corpus once."""
+    return frozenset(stopwords.words('english'))
+
+@lru_cache(maxsize=1)
+def _get_nlp():
     """
-    Count words with three or more syllables.
+    Load the spaCy pipeline used for sentence and word tokenization.
     
-    Args:
-        words (list): List of words to analyze
-        
     Returns:
-        int: Number of complex words (words with 3+ syllables)
+        Language: spaCy pipeline reduced to the tokenizer and a rule-based
+        sentencizer, loaded once and reused for every paragraph.
+    """
+    nlp = spacy.load('en_core_web_sm', disable=['tok2vec', 'tagger', 'parser',
+                                                'attribute_ruler', 'lemmatizer', 'ner'])
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+def _doc_words(doc):
+    """
+    Return lowercased word tokens from a spaCy Doc, skipping punctuation and whitespace.
+    
+    Note:
+        Each token.lower_ access builds a new string, so words are interned
+        to let repeated tokens (and the word counts keyed by them) share a
+        single string object.
+    """
+    return [sys.intern(token.lower_) for token in doc if not (token.is_punct or token.is_space)]
+
+# Single-character punctuation tokens, as a set for constant-time lookups
+_PUNCT = frozenset(string.punctuation)
+
+# Technical terms preserved by the spell checker
+TECHNICAL_TERMS = {
+    'NLP', 'AI', 'pangram', 'chatbots', 'analytics',
+    'algorithm', 'algorithms', 'analytics'
+}
+
+# Frequency dictionary bundled with symspellpy
+SPELLING_DICTIONARY = files('symspellpy') / 'frequency_dictionary_en_82_765.txt'
+
+# The bundled dictionary only has British -yse spellings, so the US -yze
+# forms (e.g. 'analyze') are added to keep them from being "corrected"
+US_YZE_STEMS = ('analy', 'reanaly', 'psychoanaly', 'paraly', 'cataly',
+                'hydroly', 'electroly', 'dialy', 'breathaly')
+SUPPLEMENTARY_WORDS = {stem + suffix for stem in US_YZE_STEMS
+                       for suffix in ('ze', 'zed', 'zes', 'zing', 'zer', 'zers')}
+
+# Maximum edit distance considered for spelling corrections
+MAX_EDIT_DISTANCE = 2
+
+@lru_cache(maxsize=1)
+def _get_spell_checker():
+    """
+    Build the spell checker once, with technical terms and US spellings added to its dictionary.
+    
+    Returns:
+        SymSpell: Shared spell checker reused for every paragraph
+    """
+    spell = SymSpell(max_dictionary_edit_distance=MAX_EDIT_DISTANCE)
+    spell.load_dictionary(str(SPELLING_DICTIONARY), term_index=0, count_index=1)
+    for term in TECHNICAL_TERMS:
+        spell.create_dictionary_entry(term.lower(), 1_000_000)
+    # Rank US spellings like their British counterparts
+    for word in SUPPLEMENTARY_WORDS:
+        spell.create_dictionary_entry(word, spell.words.get(word.replace('yz', 'ys'), 1))
+    return spell
+
+@lru_cache(maxsize=100_000)
+def _correct_word(word):
+    """
+    Return the most likely correction for a lowercased word, or None if there is none.
+    
+    Memoized so repeated misspellings across the document are looked up once.
+    """
+    suggestions = _get_spell_checker().lookup(word, Verbosity.CLOSEST,
+                                              max_edit_distance=MAX_EDIT_DISTANCE)
+    return suggestions[0].term if suggestions else None
+
+def _needs_check(word, known_words):
+    """Return True if a token should be looked up for a spelling correction."""
+    # Skip whitespace, punctuation, numbers, and known terms
+    if (word.isspace() or word in _PUNCT or word.isdigit() or 
+        word in TECHNICAL_TERMS or word.isupper()):
+        return False
         
+    # Preserve contractions
+    if "'" in word:
+        return False
+        
+    return word.lower() not in known_words
+
+def _is_word_fragment(token):
+    """
+    Return True if a token is only part of a word the tokenizer split apart.
+    
     Note:
-        Words ending in -es, -ed, or -ing are not counted as complex
-        to avoid overestimating text complexity.
+        spaCy's tokenizer exceptions split contractions and slang written
+        without an apostrophe (e.g. "cant" -> "ca" + "nt", "gonna" -> "gon" +
+        "na", "Im" -> "I" + "m"). Spell-checking such fragments one by one
+        mangles the word, so they are preserved like other contractions.
     """
-    complex_words = 0
-    for word in words:
-        syllable_count = count_syllables(word)
-        if syllable_count >= 3:
-            # Exclude common suffixes like -es, -ed, or -ing
-            if not (word.endswith(('es', 'ed', 'ing'))):
-                complex_words += 1
-    return complex_words
+    doc = token.doc
+    glued_to_prev = (token.i > 0 and not doc[token.i - 1].whitespace_
+                     and doc[token.i - 1].is_alpha)
+    glued_to_next = (not token.whitespace_ and token.i + 1 < len(doc)
+                     and doc[token.i + 1].is_alpha)
+    return (token.is_alpha and (glued_to_prev or glued_to_next)) or token.norm_ != token.lower_
+
+# Lookup table of lowercase ASCII vowels, indexed by code point
+_VOWEL_LUT = np.zeros(128, dtype=bool)
+_VOWEL_LUT[list(b'aeiouy')] = True
+
+# Common suffixes that keep a word from counting as complex
+_SIMPLE_SUFFIXES = ('es', 'ed', 'ing')
 
-def count_syllables(word):
+# Three vowel groups need at least five characters (vowel-consonant-vowel-consonant-vowel)
+_MIN_COMPLEX_LENGTH = 5
+
+def count_complex_words(words):
     """
-    Count the number of syllables in a word using vowel group counting.
+    Count words with three or more syllables.
     
     Args:
-        word (str): Word to count syllables in
+        words (list): List of words to analyze
         
     Returns:
-        int: Number of syllables
+        int: Number of complex words (words with 3+ syllables)
         
     Note:
-        Uses a simple vowel counting algorithm with adjustments for:
-        - Silent 'e' at word end
-        - Consecutive vowels counted as one
-        - Minimum syllable count of 1
+        Words ending in -es, -ed, or -ing are not counted as complex
+        to avoid overestimating text complexity. Words are first filtered
+        by those suffixes and by length, then syllables for the remaining
+        words are counted in one vectorized NumPy pass over their code
+        points: each vowel group is one syllable, a trailing silent 'e'
+        is subtracted, and every word has at least one syllable.
     """
-    word = word.lower()
-    count = 0
-    vowels = 'aeiouy'
+    # Cheap gates first, so only plausible candidates are encoded
+    words = [word for word in words
+             if len(word) >= _MIN_COMPLEX_LENGTH and not word.endswith(_SIMPLE_SUFFIXES)]
+    if not words:
+        return 0
     
-    # Count first vowel
-    if word[0] in vowels:
-        count += 1
-        
-    # Count vowel groups
-    for index in range(1, len(word)):
-        if word[index] in vowels and word[index - 1] not in vowels:
-            count += 1
+    # Encode all words as one array of code points
+    lowered = [word.lower() for word in words]
+    codes = np.frombuffer(''.join(lowered).encode('utf-32-le'), dtype=np.uint32)
+    lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=len(lowered))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
     
-    # Adjust for silent 'e'
-    if word.endswith('e'):
-        count -= 1
+    # Mark vowels and the first vowel of each vowel group within a word
+    is_vowel = _VOWEL_LUT[np.minimum(codes, 127)]
+    prev_vowel = np.zeros_like(is_vowel)
+    prev_vowel[1:] = is_vowel[:-1]
+    prev_vowel[starts[starts < len(codes)]] = False
+    group_starts = np.concatenate(([0], np.cumsum(is_vowel & ~prev_vowel)))
     
-    # Ensure minimum of 1 syllable
-    return max(1, count)
+    # Per-word syllables, adjusted for silent 'e' with a minimum of 1
+    syllables = group_starts[ends] - group_starts[starts]
+    non_empty = lengths > 0
+    syllables[non_empty] -= codes[ends[non_empty] - 1] == ord('e')
+    syllables = np.maximum(syllables, 1)
+    
+    return int(np.count_nonzero(syllables >= 3))
+
+# Prefer the compiled syllable counter (syllables.pyx) when Cython is available,
+# otherwise keep the NumPy version above
+try:
+    import pyximport
+    pyximport.install(language_level=3)
+    from syllables import count_complex_words
+except ImportError:
+    pass
 
-def calculate_gunning_fog(text):
+def calculate_gunning_fog(sentences, words):
     """
     Calculate the Gunning Fog Index for text readability.
     
     Args:
-        text (str): Text to analyze
+        sentences (list): Sentence spans of the text
+        words (list): Lowercased words of the text, without punctuation
         
     Returns:
         dict: Dictionary containing:
@@ -97,13 +233,9 @@ def calculate_gunning_fog(text):
         The Gunning Fog Index estimates years of formal education
         needed to understand the text on first reading.
     """
-    sentences = sent_tokenize(text)
-    words = [word.lower() for word in word_tokenize(text) 
-            if word not in string.punctuation]
-    
-    avg_sentence_length = len(words) / len(sentences)
+    avg_sentence_length = len(words) / len(sentences) if len(sentences) > 0 else 0
     complex_word_count = count_complex_words(words)
-    percent_complex_words = (complex_word_count / len(words)) * 100
+    percent_complex_words = (complex_word_count / len(words)) * 100 if len(words) > 0 else 0
     gunning_fog = 0.4 * (avg_sentence_length + percent_complex_words)
     
     return {
@@ -121,66 +253,48 @@ def fix_spelling(text):
         text (str): Text to check for spelling errors
         
     Returns:
-        tuple: (corrected_text, list_of_corrections)
-            - corrected_text: Text with spelling fixes
+        tuple: (corrected_doc, list_of_corrections)
+            - corrected_doc: spaCy Doc of the text with spelling fixes,
+              ready to pass to analyze_text()
             - list_of_corrections: List of (original, corrected) pairs
             
     Note:
         Preserves technical terms, abbreviations, and contractions.
         Maintains original spacing and punctuation.
     """
-    spell = SpellChecker()
+    nlp = _get_nlp()
+    known_words = _get_spell_checker().words
     
-    # Add technical terms to the dictionary
-    technical_terms = {
-        'NLP', 'AI', 'pangram', 'chatbots', 'analytics',
-        'algorithm', 'algorithms', 'analytics'
-    }
-    for term in technical_terms:
-        spell.word_frequency.load_words([term])
+    doc = nlp.make_doc(text)
+    words = [token.text for token in doc]
+    checked = [_needs_check(token.text, known_words) and not _is_word_fragment(token)
+               for token in doc]
+    fixes = {word.lower(): _correct_word(word.lower()) for word, check in zip(words, checked) if check}
     
-    words = word_tokenize(text)
     corrections = []
     fixed_words = []
     
-    for word in words:
-        # Skip punctuation, numbers, and known terms
-        if (word in string.punctuation or word.isdigit() or 
-            word in technical_terms or word.isupper()):
-            fixed_words.append(word)
-            continue
-            
-        # Preserve contractions
-        if "'" in word:
-            fixed_words.append(word)
-            continue
-            
-        # Check spelling
-        if not spell.known([word.lower()]):
-            correction = spell.correction(word)
-            if correction and correction != word:
-                corrections.append((word, correction))
-                fixed_words.append(correction)
-            else:
-                fixed_words.append(word)
+    for word, check in zip(words, checked):
+        correction = fixes[word.lower()] if check else None
+        if correction and correction != word:
+            corrections.append((word, correction))
+            fixed_words.append(correction)
         else:
             fixed_words.append(word)
     
-    # Reconstruct text with proper spacing
-    fixed_text = ""
-    for i, word in enumerate(fixed_words):
-        if i > 0 and not word in string.punctuation:
-            fixed_text += " "
-        fixed_text += word
+    # Rebuild the Doc with the original spacing and split it into sentences
+    fixed_doc = Doc(nlp.vocab, words=fixed_words,
+                    spaces=[bool(token.whitespace_) for token in doc])
     
-    return fixed_text, corrections
+    return nlp(fixed_doc), corrections
 
-def analyze_text(text):
+def analyze_text(doc):
     """
     Perform comprehensive text analysis.
     
     Args:
-        text (str): Text to analyze
+        doc (Doc): Text processed by the analyzer's spaCy pipeline,
+            such as the corrected Doc returned by fix_spelling()
         
     Returns:
         dict: Dictionary containing various text metrics:
@@ -191,34 +305,27 @@ def analyze_text(text):
     Note:
         Downloads required NLTK data if not already present.
     """
-    # Download required NLTK data
-    try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('punkt')
-        nltk.download('stopwords')
+    _ensure_nltk_data()
 
     # Basic statistics
-    sentences = sent_tokenize(text)
-    words = word_tokenize(text)
-    words = [word.lower() for word in words if word not in string.punctuation]
+    sentences = list(doc.sents)
+    words = _doc_words(doc)
     
     # Remove stopwords for frequency analysis
-    stop_words = set(stopwords.words('english'))
+    stop_words = _get_stop_words()
     filtered_words = [word for word in words if word not in stop_words]
     
     # Calculate metrics
-    freq_dist = FreqDist(filtered_words)
-    readability = calculate_gunning_fog(text)
+    word_counts = Counter(filtered_words)
+    readability = calculate_gunning_fog(sentences, words)
     
     return {
         'num_sentences': len(sentences),
         'num_words': len(words),
         'num_unique_words': len(set(words)),
         'avg_words_per_sentence': len(words) / len(sentences) if len(sentences) > 0 else 0,
-        'most_common_words': dict(freq_dist.most_common(5)),
-        'word_frequency': dict(Counter(filtered_words)),
+        'most_common_words': dict(word_counts.most_common(5)),
+        'word_frequency': dict(word_counts),
         'readability': readability
     }
 
@@ -259,6 +366,26 @@ def ensure_directories():
     Path('data/in').mkdir(parents=True, exist_ok=True)
     Path('data/out').mkdir(parents=True, exist_ok=True)
 
+def iter_paragraphs(file):
+    """
+    Yield paragraphs from an open text file as it is read.
+    
+    Args:
+        file (iterable): Open text file or other iterable of lines
+        
+    Yields:
+        str: Each paragraph (lines separated by blank lines), stripped
+    """
+    lines = []
+    for line in file:
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield ''.join(lines).strip()
+            lines = []
+    if lines:
+        yield ''.join(lines).strip()
+
 def process_text_file(input_file, output_file=None):
     """
     Process a text file paragraph by paragraph with full analysis.
@@ -268,44 +395,44 @@ def process_text_file(input_file, output_file=None):
         output_file (str, optional): Path to save corrected text
         
     Note:
-        - Processes text paragraph by paragraph
+        - Streams text paragraph by paragraph without reading the whole file
         - Performs spell checking and text analysis
-        - Saves corrected text if output_file is specified
+        - Saves corrected text incrementally if output_file is specified
         - Prints detailed analysis for each paragraph
     """
     # Ensure directories exist
     ensure_directories()
     
     try:
-        with open(input_file, 'r') as file:
-            text = file.read()
-            
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        print(f"\nFound {len(paragraphs)} paragraphs in the text file.")
-        
-        fixed_paragraphs = []
-        all_corrections = []
-        
-        for i, paragraph in enumerate(paragraphs, 1):
-            print(f"\n--- Paragraph {i} ---")
-            print("Original:", paragraph)
-            
-            fixed_text, corrections = fix_spelling(paragraph)
-            fixed_paragraphs.append(fixed_text)
-            print("Corrected:", fixed_text)
-            
-            if corrections:
-                print("\nSpelling corrections:")
-                for original, corrected in corrections:
-                    print(f"  {original} -> {corrected}")
-                all_corrections.extend(corrections)
+        with open(input_file, 'r') as file, \
+                (open(output_file, 'w') if output_file else nullcontext()) as out:
+            num_paragraphs = 0
+            all_corrections = []
             
-            results = analyze_text(fixed_text)
-            print_analysis(results, i)
+            for i, paragraph in enumerate(iter_paragraphs(file), 1):
+                num_paragraphs = i
+                print(f"\n--- Paragraph {i} ---")
+                print("Original:", paragraph)
+                
+                fixed_doc, corrections = fix_spelling(paragraph)
+                fixed_text = fixed_doc.text
+                print("Corrected:", fixed_text)
+                
+                # Write each corrected paragraph as soon as it is ready
+                if output_file:
+                    out.write(fixed_text if i == 1 else '\n\n' + fixed_text)
+                
+                if corrections:
+                    print("\nSpelling corrections:")
+                    for original, corrected in corrections:
+                        print(f"  {original} -> {corrected}")
+                    all_corrections.extend(corrections)
+                
+                results = analyze_text(fixed_doc)
+                print_analysis(results, i)
         
+        print(f"\nProcessed {num_paragraphs} paragraphs in the text file.")
         if output_file:
-            with open(output_file, 'w') as file:
-                file.write('\n\n'.join(fixed_paragraphs))
             print(f"\nCorrected text saved to {output_file}")
             
         if all_corrections:
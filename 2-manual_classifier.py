@@ -9,98 +9,131 @@ The classification is based on keyword matching and paragraph analysis.
 """
 
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import ahocorasick
+
+# Common patterns in medical cases
+MEDICAL_CASE_PATTERNS = [
+    r'\b\d+[-\s]year[-\s]old\b',  # Age pattern
+    r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',  # Presentation pattern
+    r'\bpatient\b',  # Patient reference
+    r'\bdiagnosis\b',  # Diagnosis mention
+    r'\b(symptoms?|signs?)\b',  # Symptoms/signs
+    r'\b(pain|ache|discomfort)\b',  # Pain/discomfort
+    r'\b(treatment|medication)\b',  # Treatment-related
+    r'\b(medical|clinical)\b',  # Medical context
+    r'\b(doctor|physician|nurse)\b',  # Healthcare providers
+    r'\b(hospital|clinic|emergency)\b',  # Healthcare settings
+]
+
+# Fused into a single alternation so each paragraph is scanned once
+MEDICAL_CASE_RE = re.compile('|'.join(f'(?:{p})' for p in MEDICAL_CASE_PATTERNS), re.IGNORECASE)
+
+# Keywords indicating technology-related content
+TECH_KEYWORDS = {
+    'technology', 'computer', 'artificial intelligence', 'ai', 'machine learning',
+    'nlp', 'algorithm', 'digital', 'chatbot', 'analytics', 'data',
+    'recommendation', 'facial recognition', 'autonomous', 'smart'
+}
+
+# Keywords indicating medical-related content
+MEDICAL_KEYWORDS = {
+    'patient', 'diagnosis', 'symptoms', 'pain', 'medical', 'clinical',
+    'treatment', 'disease', 'hospital', 'doctor', 'fever', 'bleeding',
+    'presents with', 'complains of', 'injury', 'swelling', 'fatigue',
+    'nausea', 'vomiting', 'headache', 'chest', 'heart', 'breathing',
+    'blood', 'medication', 'surgery', 'examination', 'condition',
+    'chronic', 'acute', 'prescription', 'therapy', 'healthcare'
+}
+
+def build_keyword_automaton(keywords_by_category):
+    """
+    Build an Aho-Corasick automaton over all category keywords.
+    
+    Each keyword maps to its (category, keyword) pair so a single pass over
+    the text reports every keyword present, for every category at once.
+    """
+    automaton = ahocorasick.Automaton()
+    for category, keywords in keywords_by_category.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (category, keyword))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton({
+    'technology': TECH_KEYWORDS,
+    'medical': MEDICAL_KEYWORDS,
+})
+
+def count_keywords(text):
+    """
+    Count the distinct keywords of each category present in lowercased text.
+    
+    Returns:
+        Counter: Number of matched keywords keyed by category
+    """
+    matched = {value for _, value in KEYWORD_AUTOMATON.iter(text)}
+    return Counter(category for category, _ in matched)
+
+# Below this many paragraphs, worker start-up costs more than it saves
+PARALLEL_MIN_PARAGRAPHS = 8
+
 def ensure_directories():
     """Create necessary directories if they don't exist."""
     Path('data/in').mkdir(parents=True, exist_ok=True)
     Path('data/out').mkdir(parents=True, exist_ok=True)
 
 def load_text(filename):
-    """Load text from a file and split into paragraphs."""
+    """Stream paragraphs (separated by blank lines) from a file as it is read."""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            # Split text into paragraphs (separated by blank lines)
-            text = file.read()
-            paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-            return paragraphs
+        file = open(filename, 'r', encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: Could not find file {filename}")
-        return []
-
-def is_technology_related(paragraph):
-    """
-    Determine if a paragraph is technology-related based on keywords and context.
-    """
-    tech_keywords = {
-        'technology', 'computer', 'artificial intelligence', 'ai', 'machine learning',
-        'nlp', 'algorithm', 'digital', 'chatbot', 'analytics', 'data',
-        'recommendation', 'facial recognition', 'autonomous', 'smart'
-    }
-    
-    # Convert paragraph to lowercase for case-insensitive matching
-    paragraph_lower = paragraph.lower()
-    
-    # First check if it's a medical case - if so, it's not technology-related
-    if is_medical_case(paragraph_lower):
-        return False
-    
-    # Count how many tech keywords are present
-    keyword_count = sum(1 for keyword in tech_keywords 
-                       if keyword in paragraph_lower)
+        return
     
-    return keyword_count > 0
+    with file:
+        lines = []
+        for line in file:
+            if line.strip():
+                lines.append(line)
+            elif lines:
+                yield ''.join(lines).strip()
+                lines = []
+        if lines:
+            yield ''.join(lines).strip()
 
 def is_medical_case(text):
     """
     Check if the text represents a medical case presentation.
     """
-    # Common patterns in medical cases
-    patterns = [
-        r'\b\d+[-\s]year[-\s]old\b',  # Age pattern
-        r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',  # Presentation pattern
-        r'\bpatient\b',  # Patient reference
-        r'\bdiagnosis\b',  # Diagnosis mention
-        r'\b(symptoms?|signs?)\b',  # Symptoms/signs
-        r'\b(pain|ache|discomfort)\b',  # Pain/discomfort
-        r'\b(treatment|medication)\b',  # Treatment-related
-        r'\b(medical|clinical)\b',  # Medical context
-        r'\b(doctor|physician|nurse)\b',  # Healthcare providers
-        r'\b(hospital|clinic|emergency)\b',  # Healthcare settings
-    ]
-    
-    # Check for medical case patterns
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    
-    return False
+    return bool(MEDICAL_CASE_RE.search(text))
 
-def is_medical_related(paragraph):
+def classify_paragraph(paragraph):
     """
-    Determine if a paragraph is medical-related based on keywords, patterns, and context.
-    """
-    medical_keywords = {
-        'patient', 'diagnosis', 'symptoms', 'pain', 'medical', 'clinical',
-        'treatment', 'disease', 'hospital', 'doctor', 'fever', 'bleeding',
-        'presents with', 'complains of', 'injury', 'swelling', 'fatigue',
-        'nausea', 'vomiting', 'headache', 'chest', 'heart', 'breathing',
-        'blood', 'medication', 'surgery', 'examination', 'condition',
-        'chronic', 'acute', 'prescription', 'therapy', 'healthcare'
-    }
+    Classify a single paragraph based on keywords, patterns, and context.
     
+    Returns:
+        str: 'medical' or 'technology' or None
+    """
     # Convert paragraph to lowercase for case-insensitive matching
     paragraph_lower = paragraph.lower()
     
-    # First check if it's a medical case
+    # A medical case presentation is medical, never technology
     if is_medical_case(paragraph_lower):
-        return True
+        return 'medical'
     
-    # Count how many medical keywords are present
-    keyword_count = sum(1 for keyword in medical_keywords 
-                       if keyword in paragraph_lower)
+    # Count keywords of both categories in a single pass
+    keyword_counts = count_keywords(paragraph_lower)
     
-    return keyword_count > 0
+    # Check medical first, as it's more specific
+    if keyword_counts['medical'] > 0:
+        return 'medical'
+    if keyword_counts['technology'] > 0:
+        return 'technology'
+    return None
 
 def classify_text(input_file, tech_file, medical_file):
     """
@@ -110,18 +143,23 @@ def classify_text(input_file, tech_file, medical_file):
     ensure_directories()
     
     # Load and classify paragraphs
-    paragraphs = load_text(input_file)
+    paragraphs = list(load_text(input_file))
     if not paragraphs:
         return
     
+    if len(paragraphs) < PARALLEL_MIN_PARAGRAPHS:
+        categories = [classify_paragraph(paragraph) for paragraph in paragraphs]
+    else:
+        with ProcessPoolExecutor() as executor:
+            categories = list(executor.map(classify_paragraph, paragraphs, chunksize=16))
+    
     tech_paragraphs = []
     medical_paragraphs = []
     
-    for paragraph in paragraphs:
-        # Check medical first, as it's more specific
-        if is_medical_related(paragraph):
+    for paragraph, category in zip(paragraphs, categories):
+        if category == 'medical':
             medical_paragraphs.append(paragraph)
-        elif is_technology_related(paragraph):
+        elif category == 'technology':
             tech_paragraphs.append(paragraph)
     
     # Write technology-related content
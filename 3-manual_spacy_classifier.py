@@ -9,10 +9,92 @@ The classification uses spaCy's NLP capabilities for more accurate text classifi
 """
 
 import spacy
+from spacy.matcher import PhraseMatcher
 from pathlib import Path
+from collections import Counter
 import re
 import sys
 import subprocess
+from functools import lru_cache
+from itertools import chain, islice
+
+# Medical case patterns (age and presentation)
+MEDICAL_CASE_PATTERNS = [
+    r'\b\d+[-\s]year[-\s]old\b',
+    r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',
+]
+
+# Fused into a single alternation so each paragraph is scanned once
+MEDICAL_CASE_RE = re.compile('|'.join(f'(?:{p})' for p in MEDICAL_CASE_PATTERNS), re.IGNORECASE)
+
+# Technology-related terms and patterns
+TECH_TERMS = {
+    'technology', 'computer', 'artificial intelligence', 'ai', 'machine learning',
+    'nlp', 'algorithm', 'digital', 'chatbot', 'analytics', 'data science',
+    'neural network', 'deep learning', 'automation', 'programming'
+}
+
+# Medical-related terms
+MEDICAL_TERMS = {
+    'patient', 'diagnosis', 'symptoms', 'treatment', 'disease', 'hospital',
+    'doctor', 'clinical', 'medical', 'surgery', 'medication', 'therapy',
+    'healthcare', 'physician', 'nurse', 'clinic'
+}
+
+def term_forms(term):
+    """
+    Return a term together with its plural form.
+    
+    Terms already ending in 's' are returned as-is; a final consonant + 'y'
+    becomes 'ies' (e.g. 'technology' -> 'technologies').
+    """
+    if term.endswith('s'):
+        return [term]
+    if term.endswith('y') and term[-2] not in 'aeiou':
+        return [term, term[:-1] + 'ies']
+    return [term, term + 's']
+
+# Base term for every matchable form, so a term and its plural count once
+TERM_BY_FORM = {form: term for term in TECH_TERMS | MEDICAL_TERMS for form in term_forms(term)}
+
+def build_term_matcher(nlp):
+    """
+    Build a PhraseMatcher over the technology and medical terms.
+    
+    Terms and their plurals are matched case-insensitively on whole tokens,
+    in a single pass over each Doc, with the category as the match label.
+    
+    Returns:
+        PhraseMatcher: Matcher with 'technology' and 'medical' patterns
+    """
+    matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+    matcher.add('technology', [nlp.make_doc(form) for term in TECH_TERMS for form in term_forms(term)])
+    matcher.add('medical', [nlp.make_doc(form) for term in MEDICAL_TERMS for form in term_forms(term)])
+    return matcher
+
+# Only entities are read from the Doc; term matching works on token text
+UNUSED_PIPES = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer']
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Load the spaCy model once, downloading it first if it is missing.
+    
+    Returns:
+        Language: Shared spaCy pipeline
+    """
+    try:
+        nlp = spacy.load('en_core_web_sm', disable=UNUSED_PIPES)
+        print("Loaded spaCy model successfully")
+    except OSError:
+        print("Downloading spaCy model...")
+        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
+        nlp = spacy.load('en_core_web_sm', disable=UNUSED_PIPES)
+    return nlp
+
+# Below this many paragraphs, loading the model in each worker process costs
+# more than it saves
+PARALLEL_MIN_PARAGRAPHS = 256
 
 def ensure_directories():
     """Create necessary directories if they don't exist."""
@@ -20,33 +102,33 @@ def ensure_directories():
     Path('data/out').mkdir(parents=True, exist_ok=True)
 
 def load_text(filename):
-    """Load text from a file and split into paragraphs."""
+    """Stream paragraphs (separated by blank lines) from a file as it is read."""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            # Split text into paragraphs (separated by blank lines)
-            text = file.read()
-            paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-            return paragraphs
+        file = open(filename, 'r', encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: Could not find file {filename}")
-        return []
+        return
+    
+    with file:
+        lines = []
+        for line in file:
+            if line.strip():
+                lines.append(line)
+            elif lines:
+                yield ''.join(lines).strip()
+                lines = []
+        if lines:
+            yield ''.join(lines).strip()
 
 def is_medical_case(doc):
     """
     Check if the text represents a medical case using spaCy's entity recognition.
     """
-    # Check for medical case patterns
-    medical_patterns = [
-        r'\b\d+[-\s]year[-\s]old\b',
-        r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',
-    ]
-    
     text = doc.text.lower()
     
     # Check for medical case patterns
-    for pattern in medical_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+    if MEDICAL_CASE_RE.search(text):
+        return True
     
     # Check for medical entities and common medical terms
     medical_ents = [ent for ent in doc.ents if ent.label_ in {'DISEASE', 'SYMPTOM'}]
@@ -57,43 +139,39 @@ def is_medical_case(doc):
     
     return False
 
-def classify_paragraph(nlp, paragraph):
+def classify_paragraph(doc, matcher):
     """
     Classify a paragraph using spaCy's NLP capabilities.
     
+    Args:
+        doc (Doc): Paragraph already processed by the spaCy pipeline
+        matcher (PhraseMatcher): Term matcher from build_term_matcher()
+    
     Returns:
         str: 'medical' or 'technology' or None
     """
-    doc = nlp(paragraph)
-    
     # First check if it's a medical case
     if is_medical_case(doc):
         return 'medical'
     
-    # Technology-related terms and patterns
-    tech_terms = {
-        'technology', 'computer', 'artificial intelligence', 'ai', 'machine learning',
-        'nlp', 'algorithm', 'digital', 'chatbot', 'analytics', 'data science',
-        'neural network', 'deep learning', 'automation', 'programming'
-    }
-    
-    # Medical-related terms
-    medical_terms = {
-        'patient', 'diagnosis', 'symptoms', 'treatment', 'disease', 'hospital',
-        'doctor', 'clinical', 'medical', 'surgery', 'medication', 'therapy',
-        'healthcare', 'physician', 'nurse', 'clinic'
-    }
-    
-    # Convert paragraph to lowercase for term matching
-    text_lower = paragraph.lower()
+    # Match all terms in one pass, keeping distinct terms per category
+    matched_terms = set()
+    tech_spans = []
+    for match_id, start, end in matcher(doc):
+        category = doc.vocab.strings[match_id]
+        form = ' '.join(token.lower_ for token in doc[start:end])
+        matched_terms.add((category, TERM_BY_FORM.get(form, form)))
+        if category == 'technology':
+            tech_spans.append((start, end))
     
     # Count matches for each category
-    tech_count = sum(1 for term in tech_terms if term in text_lower)
-    medical_count = sum(1 for term in medical_terms if term in text_lower)
+    term_counts = Counter(category for category, _ in matched_terms)
+    tech_count = term_counts['technology']
+    medical_count = term_counts['medical']
     
     # Check for technology-specific entities
     tech_ents = [ent for ent in doc.ents if ent.label_ in {'ORG', 'PRODUCT', 'GPE'} 
-                 and any(term in ent.text.lower() for term in tech_terms)]
+                 and any(ent.start <= s and e <= ent.end for s, e in tech_spans)]
     tech_count += len(tech_ents)
     
     # Classify based on the stronger match
@@ -111,26 +189,38 @@ def classify_text(nlp, input_file, tech_file, medical_file):
     # Ensure directories exist
     ensure_directories()
     
-    # Load and classify paragraphs
+    # Stream and classify paragraphs
     paragraphs = load_text(input_file)
-    if not paragraphs:
-        return
+    num_paragraphs = 0
     
     tech_paragraphs = []
     medical_paragraphs = []
     
     print("Processing paragraphs...")
-    for i, paragraph in enumerate(paragraphs, 1):
-        category = classify_paragraph(nlp, paragraph)
+    matcher = build_term_matcher(nlp)
+    
+    # Look ahead a bounded number of paragraphs so small inputs stay in-process
+    head = list(islice(paragraphs, PARALLEL_MIN_PARAGRAPHS))
+    n_process = -1 if len(head) == PARALLEL_MIN_PARAGRAPHS else 1
+    
+    # Stream paragraphs through the pipeline in batches, across worker processes for large inputs
+    docs = nlp.pipe(chain(head, paragraphs), batch_size=32, n_process=n_process)
+    for i, doc in enumerate(docs, 1):
+        num_paragraphs = i
+        category = classify_paragraph(doc, matcher)
         if category == 'medical':
-            medical_paragraphs.append(paragraph)
+            medical_paragraphs.append(doc.text)
             print(f"Paragraph {i}: Medical")
         elif category == 'technology':
-            tech_paragraphs.append(paragraph)
+            tech_paragraphs.append(doc.text)
             print(f"Paragraph {i}: Technology")
         else:
             print(f"Paragraph {i}: Unclassified")
     
+    # Nothing to write if the file was missing or empty
+    if not num_paragraphs:
+        return
+    
     # Write technology-related content
     with open(tech_file, 'w', encoding='utf-8') as file:
         file.write('\n\n'.join(tech_paragraphs))
@@ -148,13 +238,7 @@ def main():
         sys.exit(1)
     
     # Load spaCy model
-    try:
-        nlp = spacy.load('en_core_web_sm')
-        print("Loaded spaCy model successfully")
-    except OSError:
-        print("Downloading spaCy model...")
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
-        nlp = spacy.load('en_core_web_sm')
+    nlp = get_nlp()
     
     # File paths
     input_file = 'data/in/raw-data.txt'
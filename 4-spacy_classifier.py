@@ -13,7 +13,82 @@ from pathlib import Path
 import re
 import sys
 import subprocess
+from functools import lru_cache
+from itertools import chain, islice
 from collections import Counter
+from dataclasses import dataclass, field
+
+# Medical case patterns (age and presentation)
+MEDICAL_CASE_PATTERNS = [
+    r'\b\d+[-\s]year[-\s]old\b',
+    r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',
+]
+
+# Fused into a single alternation so each paragraph is scanned once
+MEDICAL_CASE_RE = re.compile('|'.join(f'(?:{p})' for p in MEDICAL_CASE_PATTERNS), re.IGNORECASE)
+
+# Entity labels indicating medical content
+MEDICAL_ENTITY_LABELS = {'DISEASE', 'SYMPTOM', 'CONDITION', 'BODY', 'PERSON'}
+
+# Medical verbs and their objects
+MEDICAL_VERBS = {
+    'diagnose', 'treat', 'prescribe', 'examine', 'present',
+    'administer', 'consult', 'assess', 'monitor', 'evaluate',
+    'recover', 'suffer', 'hospitalize', 'inject', 'medicate',
+    'operate', 'screen', 'heal', 'sedate', 'vaccinate',
+    'deteriorate', 'improve', 'manifest', 'refer', 'discharge'
+}
+
+# Medical noun chunk roots
+MEDICAL_INDICATORS = {'patient', 'symptoms', 'diagnosis', 'treatment'}
+
+# Entity labels indicating technology content
+TECH_ENTITY_LABELS = {'ORG', 'PRODUCT', 'GPE', 'EVENT'}
+
+# Technology-related verbs and their objects
+TECH_VERBS = {
+    'compute', 'process', 'analyze', 'automate', 'program',
+    'debug', 'deploy', 'optimize', 'code', 'encrypt',
+    'decrypt', 'configure', 'install', 'update', 'sync',
+    'backup', 'download', 'upload', 'stream', 'compile',
+    'execute', 'implement', 'integrate', 'interface', 'network',
+    'render', 'scale', 'test', 'validate', 'virtualize',
+    # NLP-specific verbs
+    'understand', 'interpret', 'manipulate', 'parse', 'tokenize',
+    'classify', 'translate', 'recognize', 'extract', 'generate'
+}
+
+# Technology noun chunk roots
+TECH_INDICATORS = {
+    'algorithm', 'system', 'data', 'software', 'technology',
+    'language processing', 'nlp', 'artificial intelligence',
+    'computer science', 'computing', 'machine learning'
+}
+
+# Sentence root verbs used as a final tie-breaker
+SENTENCE_TECH_VERBS = {'compute', 'process', 'analyze', 'develop', 'implement'}
+SENTENCE_MEDICAL_VERBS = {'diagnose', 'treat', 'examine', 'prescribe', 'heal'}
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Load the spaCy model once, downloading it first if it is missing.
+    
+    Returns:
+        Language: Shared spaCy pipeline
+    """
+    try:
+        nlp = spacy.load('en_core_web_sm')
+        print("Loaded spaCy model successfully")
+    except OSError:
+        print("Downloading spaCy model...")
+        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
+        nlp = spacy.load('en_core_web_sm')
+    return nlp
+
+# Below this many paragraphs, loading the model in each worker process costs
+# more than it saves
+PARALLEL_MIN_PARAGRAPHS = 256
 
 def ensure_directories():
     """Create necessary directories if they don't exist."""
@@ -21,130 +96,116 @@ def ensure_directories():
     Path('data/out').mkdir(parents=True, exist_ok=True)
 
 def load_text(filename):
-    """Load text from a file and split into paragraphs."""
+    """Stream paragraphs (separated by blank lines) from a file as it is read."""
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            # Split text into paragraphs (separated by blank lines)
-            text = file.read()
-            paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-            return paragraphs
+        file = open(filename, 'r', encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: Could not find file {filename}")
-        return []
+        return
+    
+    with file:
+        lines = []
+        for line in file:
+            if line.strip():
+                lines.append(line)
+            elif lines:
+                yield ''.join(lines).strip()
+                lines = []
+        if lines:
+            yield ''.join(lines).strip()
+
+@dataclass
+class ParagraphFeatures:
+    """Linguistic features of a paragraph, collected once from its spaCy Doc."""
+    matches_case_pattern: bool
+    ent_labels: Counter = field(default_factory=Counter)
+    lemmas: set = field(default_factory=set)
+    chunk_roots: set = field(default_factory=set)
+    root_verbs: Counter = field(default_factory=Counter)
 
-def is_medical_case(doc):
+def extract_features(doc):
     """
-    Check if the text represents a medical case using spaCy's entity recognition.
+    Collect every feature the classification rules need in a single pass over the Doc.
+    
+    Args:
+        doc (Doc): Paragraph already processed by the spaCy pipeline
+    
+    Returns:
+        ParagraphFeatures: Entity labels, lemmas, noun chunk roots and
+        sentence root verbs of the paragraph
     """
-    # Medical case patterns (age and presentation)
-    medical_patterns = [
-        r'\b\d+[-\s]year[-\s]old\b',
-        r'\b(presents?|complains?|reports?|arrives?)\b.*\b(with|of)\b',
-    ]
+    features = ParagraphFeatures(matches_case_pattern=bool(MEDICAL_CASE_RE.search(doc.text)))
     
-    text = doc.text.lower()
+    for token in doc:
+        features.lemmas.add(token.lemma_)
+        # Each entity starts with exactly one 'B' token
+        if token.ent_iob_ == 'B':
+            features.ent_labels[token.ent_type_] += 1
+        # Root verb of each sentence
+        if token.dep_ == 'ROOT' and token.pos_ == 'VERB':
+            features.root_verbs[token.lemma_] += 1
     
+    features.chunk_roots.update(chunk.root.lemma_ for chunk in doc.noun_chunks)
+    return features
+
+def is_medical_case(features):
+    """
+    Check if the text represents a medical case using spaCy's entity recognition.
+    """
     # Check for medical case patterns
-    for pattern in medical_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-            
-    # Count medical-related entities
-    medical_entity_labels = {'DISEASE', 'SYMPTOM', 'CONDITION', 'BODY', 'PERSON'}
-    medical_ents = [ent for ent in doc.ents if ent.label_ in medical_entity_labels]
-    
-    # Check for medical verbs and their objects
-    medical_verbs = {
-        'diagnose', 'treat', 'prescribe', 'examine', 'present',
-        'administer', 'consult', 'assess', 'monitor', 'evaluate',
-        'recover', 'suffer', 'hospitalize', 'inject', 'medicate',
-        'operate', 'screen', 'heal', 'sedate', 'vaccinate',
-        'deteriorate', 'improve', 'manifest', 'refer', 'discharge'
-    }
-    medical_actions = any(token.lemma_ in medical_verbs for token in doc)
-    
-    # Check for medical noun chunks
-    medical_indicators = {'patient', 'symptoms', 'diagnosis', 'treatment'}
-    medical_chunks = any(chunk.root.lemma_ in medical_indicators for chunk in doc.noun_chunks)
-    
-    return len(medical_ents) > 0 or (medical_actions and medical_chunks)
-
-def is_tech_related(doc):
+    if features.matches_case_pattern:
+        return True
+    
+    # Medical-related entities
+    if any(features.ent_labels[label] for label in MEDICAL_ENTITY_LABELS):
+        return True
+    
+    # Medical verbs together with medical noun chunks
+    medical_actions = not MEDICAL_VERBS.isdisjoint(features.lemmas)
+    medical_chunks = not MEDICAL_INDICATORS.isdisjoint(features.chunk_roots)
+    return medical_actions and medical_chunks
+
+def is_tech_related(features):
     """
     Check if the text is technology-related using spaCy's entity recognition.
     """
     # Count technology-related entities
-    tech_entity_labels = {'ORG', 'PRODUCT', 'GPE', 'EVENT'}
-    tech_ents = [ent for ent in doc.ents if ent.label_ in tech_entity_labels]
-    
-    # Check for technology-related verbs and their objects
-    tech_verbs = {
-        'compute', 'process', 'analyze', 'automate', 'program',
-        'debug', 'deploy', 'optimize', 'code', 'encrypt',
-        'decrypt', 'configure', 'install', 'update', 'sync',
-        'backup', 'download', 'upload', 'stream', 'compile',
-        'execute', 'implement', 'integrate', 'interface', 'network',
-        'render', 'scale', 'test', 'validate', 'virtualize',
-        # NLP-specific verbs
-        'understand', 'interpret', 'manipulate', 'parse', 'tokenize',
-        'classify', 'translate', 'recognize', 'extract', 'generate'
-    }
-    tech_actions = any(token.lemma_ in tech_verbs for token in doc)
-    
-    # Check for technology noun chunks
-    tech_indicators = {
-        'algorithm', 'system', 'data', 'software', 'technology',
-        'language processing', 'nlp', 'artificial intelligence',
-        'computer science', 'computing', 'machine learning'
-    }
-    tech_chunks = any(chunk.root.lemma_ in tech_indicators for chunk in doc.noun_chunks)
-    
-    # Analyze dependencies and contexts
-    tech_contexts = []
-    for token in doc:
-        if token.dep_ in {'dobj', 'pobj'} and token.head.pos_ == 'VERB':
-            tech_contexts.append((token.head.lemma_, token.lemma_))
+    tech_ents = sum(features.ent_labels[label] for label in TECH_ENTITY_LABELS)
+    
+    # Technology-related verbs and noun chunks
+    tech_actions = not TECH_VERBS.isdisjoint(features.lemmas)
+    tech_chunks = not TECH_INDICATORS.isdisjoint(features.chunk_roots)
     
     # Score the technical nature of the content
-    tech_score = len(tech_ents) + sum(1 for _ in filter(None, [tech_actions, tech_chunks]))
+    tech_score = tech_ents + tech_actions + tech_chunks
     
-    return tech_score > 0 and not is_medical_case(doc)
+    return tech_score > 0 and not is_medical_case(features)
 
-def classify_paragraph(nlp, paragraph):
+def classify_paragraph(doc):
     """
     Classify a paragraph using spaCy's NLP capabilities.
     
+    Args:
+        doc (Doc): Paragraph already processed by the spaCy pipeline
+    
     Returns:
         str: 'medical' or 'technology' or None
     """
-    doc = nlp(paragraph)
+    features = extract_features(doc)
     
     # First check if it's a medical case (higher priority)
-    if is_medical_case(doc):
+    if is_medical_case(features):
         return 'medical'
     
     # Then check if it's technology-related
-    if is_tech_related(doc):
+    if is_tech_related(features):
         return 'technology'
     
-    # Analyze sentence structure and dependencies
-    sentence_types = Counter()
-    for sent in doc.sents:
-        # Analyze root verb and its arguments
-        root = sent.root
-        if root.pos_ == 'VERB':
-            # Check verb arguments and their types
-            arguments = [child for child in root.children]
-            arg_types = Counter([arg.pos_ for arg in arguments])
-            sentence_types[root.lemma_] += 1
-    
-    # Use sentence analysis for final classification
+    # Use sentence root verbs for final classification
+    sentence_types = features.root_verbs
     if sentence_types:
-        tech_verbs = {'compute', 'process', 'analyze', 'develop', 'implement'}
-        medical_verbs = {'diagnose', 'treat', 'examine', 'prescribe', 'heal'}
-        
-        tech_count = sum(count for verb, count in sentence_types.items() if verb in tech_verbs)
-        medical_count = sum(count for verb, count in sentence_types.items() if verb in medical_verbs)
+        tech_count = sum(count for verb, count in sentence_types.items() if verb in SENTENCE_TECH_VERBS)
+        medical_count = sum(count for verb, count in sentence_types.items() if verb in SENTENCE_MEDICAL_VERBS)
         
         if tech_count > medical_count:
             return 'technology'
@@ -160,26 +221,36 @@ def classify_text(nlp, input_file, tech_file, medical_file):
     # Ensure directories exist
     ensure_directories()
     
-    # Load and classify paragraphs
+    # Stream and classify paragraphs
     paragraphs = load_text(input_file)
-    if not paragraphs:
-        return
+    num_paragraphs = 0
     
     tech_paragraphs = []
     medical_paragraphs = []
     
     print("Processing paragraphs...")
-    for i, paragraph in enumerate(paragraphs, 1):
-        category = classify_paragraph(nlp, paragraph)
+    # Look ahead a bounded number of paragraphs so small inputs stay in-process
+    head = list(islice(paragraphs, PARALLEL_MIN_PARAGRAPHS))
+    n_process = -1 if len(head) == PARALLEL_MIN_PARAGRAPHS else 1
+    
+    # Stream paragraphs through the pipeline in batches, across worker processes for large inputs
+    docs = nlp.pipe(chain(head, paragraphs), batch_size=32, n_process=n_process)
+    for i, doc in enumerate(docs, 1):
+        num_paragraphs = i
+        category = classify_paragraph(doc)
         if category == 'medical':
-            medical_paragraphs.append(paragraph)
+            medical_paragraphs.append(doc.text)
             print(f"Paragraph {i}: Medical")
         elif category == 'technology':
-            tech_paragraphs.append(paragraph)
+            tech_paragraphs.append(doc.text)
             print(f"Paragraph {i}: Technology")
         else:
             print(f"Paragraph {i}: Unclassified")
     
+    # Nothing to write if the file was missing or empty
+    if not num_paragraphs:
+        return
+    
     # Write technology-related content
     with open(tech_file, 'w', encoding='utf-8') as file:
         file.write('\n\n'.join(tech_paragraphs))
@@ -197,13 +268,7 @@ def main():
         sys.exit(1)
     
     # Load spaCy model
-    try:
-        nlp = spacy.load('en_core_web_sm')
-        print("Loaded spaCy model successfully")
-    except OSError:
-        print("Downloading spaCy model...")
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
-        nlp = spacy.load('en_core_web_sm')
+    nlp = get_nlp()
     
     # File paths
     input_file = 'data/in/raw-data.txt'
@@ -0,0 +1,81 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Syllable Counting (Cython)
+
+Compiled version of count_complex_words() from 1-text_analyzer.py, with
+the vowel-group syllable counter it is built on. The per-character loop
+runs over C integers and a vowel lookup table instead of Python string
+objects.
+
+The text analyzer builds this module on first import through pyximport
+and falls back to its NumPy implementation when Cython is missing.
+"""
+
+# Lookup table of lowercase ASCII vowels, indexed by code point
+cdef bint IS_VOWEL[128]
+
+for _c in 'aeiouy':
+    IS_VOWEL[ord(_c)] = True
+
+cdef inline bint _is_vowel(Py_UCS4 c):
+    return c < 128 and IS_VOWEL[c]
+
+cpdef int count_syllables(str word):
+    """
+    Count the number of syllables in a word using vowel group counting.
+
+    Args:
+        word (str): Word to count syllables in
+
+    Returns:
+        int: Number of syllables (minimum of 1)
+    """
+    cdef Py_ssize_t i, n
+    cdef int count = 0
+    cdef bint prev_vowel, vowel
+
+    word = word.lower()
+    n = len(word)
+    if n == 0:
+        return 1
+
+    # Count first vowel
+    prev_vowel = _is_vowel(word[0])
+    if prev_vowel:
+        count += 1
+
+    # Count vowel groups
+    for i in range(1, n):
+        vowel = _is_vowel(word[i])
+        if vowel and not prev_vowel:
+            count += 1
+        prev_vowel = vowel
+
+    # Adjust for silent 'e'
+    if word[n - 1] == u'e':
+        count -= 1
+
+    # Ensure minimum of 1 syllable
+    return count if count > 1 else 1
+
+cpdef int count_complex_words(list words):
+    """
+    Count words with three or more syllables.
+
+    Args:
+        words (list): List of words to analyze
+
+    Returns:
+        int: Number of complex words (words with 3+ syllables)
+    """
+    cdef int complex_words = 0
+    cdef str word
+
+    for word in words:
+        # Cheap gates first: too short for three vowel groups, or a
+        # common suffix like -es, -ed, or -ing
+        if len(word) < 5 or word.endswith(('es', 'ed', 'ing')):
+            continue
+        if count_syllables(word) >= 3:
+            complex_words += 1
+    return complex_words